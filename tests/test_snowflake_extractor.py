@@ -0,0 +1,198 @@
+import logging
+import re
+import threading
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from warehouse_to_go.extractor.snowflake_extractor import (
+    SnowflakeExtractor,
+    _ArrowStream,
+    _DuckDBWriter,
+    _StreamAborted,
+)
+from warehouse_to_go.utils.config import Config, DuckDBConfig, WarehouseConfig
+
+CREATE_SQL = 'CREATE OR REPLACE TABLE "t" AS SELECT * FROM arrow_stream'
+
+def int_chunk(start: int, rows: int = 100) -> pa.Table:
+    return pa.table({'a': pa.array(range(start, start + rows), pa.int64())})
+
+@pytest.fixture
+def duckdb_conn():
+    conn = duckdb.connect()
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def writer(duckdb_conn):
+    writer = _DuckDBWriter(duckdb_conn)
+    yield writer
+    writer.close()
+
+def produce(stream: _ArrowStream, chunks, error: Exception = None) -> dict:
+    """Feed chunks into stream on a thread, the way a worker does."""
+    outcome = {}
+
+    def run():
+        try:
+            for chunk in chunks:
+                stream.put(chunk)
+        except _StreamAborted:
+            outcome['aborted'] = True
+            return
+        stream.close(error)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    outcome['thread'] = thread
+    return outcome
+
+def table_exists(conn, name: str) -> bool:
+    return conn.execute(
+        "SELECT count(*) FROM information_schema.tables WHERE table_name = ?", [name]
+    ).fetchone()[0] == 1
+
+def test_writer_streams_every_chunk(duckdb_conn, writer):
+    stream = _ArrowStream(int_chunk(0).schema, max_rows=30, maxsize=1)
+    done = writer.submit(CREATE_SQL, stream)
+    producer = produce(stream, [int_chunk(i * 100) for i in range(5)])
+
+    done.result(timeout=10)
+    producer['thread'].join(timeout=10)
+    assert duckdb_conn.execute('SELECT count(*), sum(a) FROM t').fetchone() == (500, sum(range(500)))
+
+def test_writer_failure_stops_the_producer(duckdb_conn, writer):
+    stream = _ArrowStream(int_chunk(0).schema, max_rows=100, maxsize=1)
+    done = writer.submit(CREATE_SQL, stream)
+    # A string chunk after int64 chunks fails inside DuckDB; the producer
+    # would otherwise block on the full buffer forever
+    bad = pa.table({'a': pa.array(['not', 'an', 'int'])})
+    chunks = [int_chunk(0), bad] + [int_chunk(i * 100) for i in range(1, 50)]
+    producer = produce(stream, chunks, error=RuntimeError('fetch failed at the end'))
+
+    with pytest.raises(duckdb.Error):
+        done.result(timeout=10)
+    producer['thread'].join(timeout=10)
+    assert not producer['thread'].is_alive()
+    assert producer.get('aborted')
+    assert not table_exists(duckdb_conn, 't')
+    # Readers still pulling from the stream, like DuckDB scan threads, are released too
+    with pytest.raises(_StreamAborted):
+        for _ in stream.reader():
+            pass
+
+    # The writer thread is still serving later statements
+    writer.write('CREATE TABLE after_failure AS SELECT 1 AS x')
+    assert table_exists(duckdb_conn, 'after_failure')
+
+def test_producer_failure_fails_the_write(duckdb_conn, writer):
+    stream = _ArrowStream(int_chunk(0).schema, max_rows=100, maxsize=1)
+    done = writer.submit(CREATE_SQL, stream)
+    producer = produce(stream, [int_chunk(0), int_chunk(100)], error=RuntimeError('network dropped'))
+
+    with pytest.raises(Exception, match='network dropped'):
+        done.result(timeout=10)
+    producer['thread'].join(timeout=10)
+    assert not producer['thread'].is_alive()
+    assert not table_exists(duckdb_conn, 't')
+
+def test_empty_stream_creates_an_empty_table(duckdb_conn, writer):
+    schema = pa.schema([('a', pa.int64()), ('b', pa.string())])
+    stream = _ArrowStream(schema, max_rows=100, maxsize=1)
+    done = writer.submit(CREATE_SQL, stream)
+    stream.close()
+
+    done.result(timeout=10)
+    assert duckdb_conn.execute('SELECT count(*) FROM t').fetchone() == (0,)
+    assert [row[:2] for row in duckdb_conn.execute('DESCRIBE t').fetchall()] == [('a', 'BIGINT'), ('b', 'VARCHAR')]
+
+class FakeCursor:
+    """Snowflake cursor stub that unloads a fixed Arrow table to Parquet."""
+
+    def __init__(self, unloaded: pa.Table, copy_error: Exception = None, remove_error: Exception = None):
+        self.unloaded = unloaded
+        self.copy_error = copy_error
+        self.remove_error = remove_error
+        self.queries = []
+
+    def execute(self, query, params=None, **kwargs):
+        self.queries.append(query.split()[0])
+        if query.startswith('COPY INTO') and self.copy_error:
+            raise self.copy_error
+        if query.startswith('GET'):
+            directory = re.search(r"'file://(.*)/'$", query).group(1).replace("''", "'")
+            pq.write_table(self.unloaded, f"{directory}/data_0_0_0.snappy.parquet")
+        if query.startswith('REMOVE') and self.remove_error:
+            raise self.remove_error
+        return self
+
+    def fetchone(self):
+        return (self.unloaded.num_rows, 0, 0)
+
+    def fetch_arrow_all(self, force_return_table=False):
+        return self.unloaded.schema.empty_table()
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor):
+        self._fake_cursor = cursor
+
+    def cursor(self):
+        return self._fake_cursor
+
+@pytest.fixture
+def target_conn(duckdb_conn):
+    duckdb_conn.execute("ATTACH ':memory:' AS DB; CREATE SCHEMA DB.S")
+    return duckdb_conn
+
+def unload(writer, cursor: FakeCursor) -> int:
+    config = Config(
+        warehouse=WarehouseConfig(account='acct', user='user', warehouse='wh', password='secret'),
+        duckdb=DuckDBConfig(database_path=Path('unused.duckdb')),
+    )
+    extractor = SnowflakeExtractor(config)
+    extractor._connect = lambda: FakeConnection(cursor)
+    return extractor._unload_table(writer, 'DB.S.T')
+
+def column_types(conn, table: str):
+    return [row[:2] for row in conn.execute(f'DESCRIBE {table}').fetchall()]
+
+def test_unload_loads_parquet_with_streamed_types(target_conn, writer):
+    unloaded = pa.table({'id': pa.array([1, 2, 3], pa.int16()), 'name': pa.array(['a', 'b', None])})
+    cursor = FakeCursor(unloaded)
+
+    assert unload(writer, cursor) == 3
+    assert target_conn.execute('SELECT count(*), sum(id) FROM DB.S.T').fetchone() == (3, 6)
+    # Narrow integers are widened exactly as on the streaming path
+    assert column_types(target_conn, 'DB.S.T') == [('id', 'BIGINT'), ('name', 'VARCHAR')]
+    assert cursor.queries == ['COPY', 'GET', 'REMOVE']
+
+def test_unload_replaces_emptied_table(target_conn, writer):
+    target_conn.execute('CREATE TABLE DB.S.T AS SELECT 42 AS stale')
+    cursor = FakeCursor(pa.table({'id': pa.array([], pa.int8())}))
+
+    assert unload(writer, cursor) == 0
+    assert target_conn.execute('SELECT count(*) FROM DB.S.T').fetchone() == (0,)
+    assert column_types(target_conn, 'DB.S.T') == [('id', 'BIGINT')]
+    assert cursor.queries == ['COPY', 'SELECT', 'REMOVE']
+
+def test_unload_logs_failed_cleanup(target_conn, writer, caplog):
+    cursor = FakeCursor(pa.table({'id': [1]}), remove_error=RuntimeError('remove failed'))
+
+    with caplog.at_level(logging.WARNING):
+        assert unload(writer, cursor) == 1
+    assert 'remove failed' in caplog.text
+
+def test_unload_failed_cleanup_keeps_original_error(target_conn, writer):
+    cursor = FakeCursor(
+        pa.table({'id': [1]}),
+        copy_error=RuntimeError('copy failed'),
+        remove_error=RuntimeError('remove failed'),
+    )
+
+    with pytest.raises(RuntimeError, match='copy failed'):
+        unload(writer, cursor)
+    assert cursor.queries == ['COPY', 'REMOVE']
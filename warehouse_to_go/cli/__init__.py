@@ -0,0 +1,60 @@
+import importlib
+import sys
+from typing import Optional
+
+import typer
+
+app = typer.Typer(
+    name="warehouse-to-go",
+    help="Tool to create local DuckDB representations of data warehouse sources from dbt projects.",
+    add_completion=False,
+)
+
+# Each command lives in warehouse_to_go.cli.<name>; the help text is repeated
+# here so top-level --help can list commands without importing them
+COMMANDS = {
+    "debug": "Initialize the configuration and test connections.",
+    "analyze": "Analyze the manifest file and show source summary.",
+    "extract": "Extract data from Snowflake to DuckDB.",
+}
+
+@app.callback()
+def main():
+    """Tool to create local DuckDB representations of Snowflake sources from dbt projects."""
+
+def _sniff_subcommand() -> Optional[str]:
+    """
+    Peek at the command line to decide which commands need registering.
+    
+    Returns:
+        The invoked command name, "" for bare/--help invocations, or None
+        when the command line can't be classified
+    """
+    args = sys.argv[1:]
+    if not args or args[0] in ("--help", "-h"):
+        return ""
+    if args[0] in COMMANDS:
+        return args[0]
+    return None
+
+def _register_command(name: str) -> None:
+    """Import a command module and register its command on the app."""
+    module = importlib.import_module(f"warehouse_to_go.cli.{name}")
+    app.command()(getattr(module, name))
+
+def _register_stub(name: str, help: str) -> None:
+    """Register a placeholder so the command is listed by top-level --help."""
+    def stub():
+        # Only registered when no command was given, so never invoked
+        pass
+    app.command(name=name, help=help)(stub)
+
+_subcommand = _sniff_subcommand()
+if _subcommand:
+    _register_command(_subcommand)
+elif _subcommand == "":
+    for _name, _help in COMMANDS.items():
+        _register_stub(_name, _help)
+else:
+    for _name in COMMANDS:
+        _register_command(_name)
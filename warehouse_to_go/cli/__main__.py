@@ -0,0 +1,4 @@
+from warehouse_to_go.cli import app
+
+if __name__ == "__main__":
+    app()
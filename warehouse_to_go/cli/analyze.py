@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.table import Table
+
+from warehouse_to_go.cli.common import (
+    CONFIG_OPTION,
+    MANIFEST_OPTION,
+    PROFILE_OPTION,
+    TARGET_OPTION,
+    console,
+    get_config,
+)
+
+def analyze(
+    config_path: Optional[Path] = CONFIG_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+    target: Optional[str] = TARGET_OPTION,
+    manifest_path: Path = MANIFEST_OPTION,
+):
+    """Analyze the manifest file and show source summary."""
+    from warehouse_to_go.extractor.manifest_parser import ManifestParser
+
+    try:
+        config = get_config(config_path, profile, target, manifest_path)
+        parser = ManifestParser(config.manifest_path)
+        sources = parser.parse_manifest()
+        
+        # Create summary table
+        table = Table(title="Source Summary")
+        table.add_column("Source", style="cyan")
+        table.add_column("Database", style="green")
+        table.add_column("Schema", style="yellow")
+        table.add_column("Tables", justify="right", style="magenta")
+        
+        for source_name, config in sources.items():
+            table.add_row(
+                source_name,
+                config.database,
+                config.schema,
+                str(len(config.tables))
+            )
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"❌ Error analyzing manifest: {str(e)}", style="red")
+        raise typer.Exit(1)
@@ -0,0 +1,75 @@
+import dataclasses
+import typer
+from pathlib import Path
+from rich.console import Console
+from typing import Optional
+
+from warehouse_to_go.utils.config import Config, load_yaml
+
+console = Console()
+
+# Options shared by every command
+CONFIG_OPTION = typer.Option(
+    None,
+    "--config",
+    "-c",
+    help="Optional path to config file. If not provided, will look for config.yml in the current directory, then fall back to defaults.",
+)
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    "-p",
+    help="Optional dbt profile to use. If not provided, will use the first warehouse profile found.",
+)
+TARGET_OPTION = typer.Option(
+    None,
+    "--target",
+    "-t",
+    help="Optional dbt target to use. If not provided, will use the profile's default target.",
+)
+MANIFEST_OPTION = typer.Option(
+    "target/manifest.json",
+    "--manifest",
+    "-m",
+    help="Path to dbt manifest.json file",
+)
+
+def get_config(
+    config_path: Optional[Path] = None,
+    profile: Optional[str] = None,
+    target: Optional[str] = None,
+    manifest_path: Optional[Path] = None,
+) -> Config:
+    """
+    Helper function to get config with optional overrides.
+    
+    Args:
+        config_path: Optional path to a config file
+        profile: Optional dbt profile to use
+        target: Optional dbt target to use
+        manifest_path: Path to dbt manifest file
+        
+    Returns:
+        Config object with the specified settings
+    """
+    # First try to load from config.yml if it exists
+    default_config_path = Path("config.yml")
+    if not config_path and default_config_path.exists():
+        config_path = default_config_path
+    
+    if config_path:
+        config = Config.from_dict(load_yaml(config_path))
+    else:
+        config = Config.from_env()
+    
+    # Config is immutable, so overrides produce an updated copy
+    if profile or target:
+        config = dataclasses.replace(config, warehouse=config.warehouse.from_dbt_profile(
+            profile_name=profile,
+            target=target
+        ))
+    
+    if manifest_path:
+        config = dataclasses.replace(config, manifest_path=Path(manifest_path))
+    
+    return config
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from warehouse_to_go.cli.common import (
+    CONFIG_OPTION,
+    MANIFEST_OPTION,
+    PROFILE_OPTION,
+    TARGET_OPTION,
+    console,
+    get_config,
+)
+
+def debug(
+    config_path: Optional[Path] = CONFIG_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+    target: Optional[str] = TARGET_OPTION,
+    manifest_path: Path = MANIFEST_OPTION,
+):
+    """Initialize the configuration and test connections."""
+    # Heavy dependencies are imported per command to keep CLI startup fast
+    import duckdb
+    from warehouse_to_go.extractor.snowflake_extractor import test_connection
+
+    try:
+        config = get_config(config_path, profile, target, manifest_path)
+            
+        # Test Snowflake connection
+        console.print("Testing Snowflake connection...", style="yellow")
+        test_connection(config)
+        console.print("✅ Snowflake connection successful!", style="green")
+        
+        # Test DuckDB creation
+        console.print("Testing DuckDB database creation...", style="yellow")
+        conn = duckdb.connect(str(config.duckdb.resolved_path))
+        conn.close()
+        console.print("✅ DuckDB database creation successful!", style="green")
+        
+        console.print("✅ Configuration initialized successfully!", style="green")
+        
+    except Exception as e:
+        console.print(f"❌ Error initializing configuration: {str(e)}", style="red")
+        raise typer.Exit(1)
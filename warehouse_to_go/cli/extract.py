@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from warehouse_to_go.cli.common import (
+    CONFIG_OPTION,
+    MANIFEST_OPTION,
+    PROFILE_OPTION,
+    TARGET_OPTION,
+    console,
+    get_config,
+)
+
+def extract(
+    config_path: Optional[Path] = CONFIG_OPTION,
+    profile: Optional[str] = PROFILE_OPTION,
+    target: Optional[str] = TARGET_OPTION,
+    manifest_path: Path = MANIFEST_OPTION,
+    source_filter: Optional[str] = typer.Option(
+        None,
+        "--source",
+        "-s",
+        help="Filter to specific source name",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show what would be extracted without actually extracting",
+    ),
+):
+    """Extract data from Snowflake to DuckDB."""
+    from warehouse_to_go.extractor.manifest_parser import ManifestParser
+    from warehouse_to_go.extractor.snowflake_extractor import SnowflakeExtractor
+
+    try:
+        # Load config
+        config = get_config(config_path, profile, target, manifest_path)
+        
+        # Build extraction plan from the manifest
+        parser = ManifestParser(config.manifest_path)
+        plan = parser.build_plan(source_filter)
+        if source_filter and not plan:
+            console.print(f"❌ No sources found matching filter: {source_filter}", style="red")
+            raise typer.Exit(1)
+        
+        if dry_run:
+            console.print("\n📋 Extraction Plan (Dry Run):", style="bold cyan")
+            for db_schema, tables in plan.items():
+                console.print(f"\n[cyan]{db_schema}[/cyan]")
+                row_limit = f"max {config.extract.row_limit:,} rows" if config.extract.row_limit else "all rows"
+                for table in tables:
+                    console.print(
+                        f"  • {table['table_name']} "
+                        f"[dim]({row_limit}, "
+                        f"{config.extract.batch_size:,} per batch)[/dim]"
+                    )
+            return
+
+        # Extract data
+        console.print("\n🚀 Starting extraction...", style="bold cyan")
+        with SnowflakeExtractor(config) as extractor:
+            extractor.extract_tables(plan)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Error during extraction: {str(e)}", style="red")
+        raise typer.Exit(1)
@@ -1,9 +1,29 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import json
+import os
+import pickle
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Manifests larger than this are streamed with ijson (when installed) so only
+# the sources subtree is materialized
+STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Version of the pickled sources cache; bump whenever TableConfig, SourceConfig
+# or the cached structure changes so stale caches are re-parsed
+CACHE_FORMAT_VERSION = 1
+
+@dataclass(frozen=True)
 class TableConfig:
     """Configuration for a table to extract."""
     name: str
@@ -11,7 +31,7 @@ class TableConfig:
     columns: Optional[List[str]] = None
     meta: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True)
 class SourceConfig:
     """Configuration for a source to extract."""
     database: str
@@ -25,6 +45,43 @@ class ManifestParser:
     def __init__(self, manifest_path: Path):
         """Initialize with path to manifest file."""
         self.manifest_path = manifest_path
+        self.cache_path = manifest_path.with_name(manifest_path.name + '.w2g-cache.pkl')
+        
+    def _load_cache(self, key: tuple) -> Optional[Dict[str, 'SourceConfig']]:
+        """Return cached sources if the cache matches the manifest's stat key."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached_key, sources = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+            return None
+        return sources if cached_key == key else None
+    
+    def _write_cache(self, key: tuple, sources: Dict[str, 'SourceConfig']) -> None:
+        """Atomically write parsed sources next to the manifest, ignoring failures."""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, sources), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        
+    def _iter_source_nodes(self, size: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (node_name, node) pairs from the manifest's sources section."""
+        if ijson is not None and (orjson is None or size > STREAMING_THRESHOLD_BYTES):
+            with open(self.manifest_path, 'rb') as f:
+                yield from ijson.kvitems(f, 'sources', use_float=True)
+            return
+        
+        if orjson is not None:
+            manifest = orjson.loads(self.manifest_path.read_bytes())
+        else:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        yield from manifest.get('sources', {}).items()
         
     def parse_manifest(self) -> Dict[str, SourceConfig]:
         """
@@ -35,58 +92,91 @@ class ManifestParser:
         """
         if not self.manifest_path.exists():
             raise FileNotFoundError(f"Manifest file not found at {self.manifest_path}")
+        
+        # Reuse the previously parsed sources while the manifest is unchanged
+        stat = self.manifest_path.stat()
+        cache_key = (CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size)
+        cached = self._load_cache(cache_key)
+        if cached is not None:
+            return cached
             
-        with open(self.manifest_path) as f:
-            manifest = json.load(f)
-            
-        sources = {}
+        # Collect source headers and their tables before building the
+        # (immutable) source configs
+        headers = {}
+        tables = {}
         
         # Process each source in the manifest
-        for node_name, node in manifest.get('sources', {}).items():
+        for node_name, node in self._iter_source_nodes(stat.st_size):
             source_name = node.get('source_name')
             if not source_name:
                 continue
                 
-            # Get or create source config
-            if source_name not in sources:
-                sources[source_name] = SourceConfig(
-                    database=node.get('database', ''),
-                    schema=node.get('schema', ''),
-                    meta=node.get('meta', {})
+            # First node seen for a source provides its database/schema/meta
+            if source_name not in headers:
+                headers[source_name] = (
+                    node.get('database', ''),
+                    node.get('schema', ''),
+                    node.get('meta', {})
                 )
+                tables[source_name] = []
                 
             # Add table config
             table_name = node.get('name', '')
             if table_name:
-                table = TableConfig(
+                tables[source_name].append(TableConfig(
                     name=table_name,
                     identifier=node.get('identifier', table_name),
                     columns=node.get('columns'),
                     meta=node.get('meta', {})
-                )
-                sources[source_name].tables.append(table)
-                
+                ))
+        
+        sources = {
+            source_name: SourceConfig(
+                database=database,
+                schema=schema,
+                tables=tables[source_name],
+                meta=meta
+            )
+            for source_name, (database, schema, meta) in headers.items()
+        }
+        
+        self._write_cache(cache_key, sources)
         return sources
 
-    def get_extraction_plan(self) -> Dict[str, List[Dict]]:
+    def build_plan(self, source_filter: Optional[str] = None) -> Dict[str, List[Dict]]:
         """
         Generate a plan for extracting data from Snowflake.
-        Returns a dictionary mapping database.schema to list of tables.
+        
+        Args:
+            source_filter: Optional source name to restrict the plan to
+            
+        Returns:
+            Dictionary mapping database.schema to list of tables
         """
         extraction_plan = {}
         
-        for source_name, source_config in self.sources.items():
+        for source_name, source_config in self.parse_manifest().items():
+            if source_filter and source_name != source_filter:
+                continue
+            
             key = f"{source_config.database}.{source_config.schema}"
-            if key not in extraction_plan:
-                extraction_plan[key] = []
+            tables = extraction_plan.setdefault(key, [])
             
+            # Tables share the source's meta dict unless they override it;
+            # consumers only read meta, so the shared reference is safe
+            source_meta = source_config.meta
             for table in source_config.tables:
-                extraction_plan[key].append({
+                table_meta = table.meta
+                if table_meta and not table_meta.items() <= source_meta.items():
+                    meta = {**source_meta, **table_meta}
+                else:
+                    meta = source_meta
+                tables.append({
                     'source_name': source_name,
                     'table_name': table.name,
                     'identifier': table.identifier,
                     'columns': table.columns,
-                    'meta': {**source_config.meta, **table.meta} if table.meta else source_config.meta
+                    'meta': meta
                 })
         
         return extraction_plan
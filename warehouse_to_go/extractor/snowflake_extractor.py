@@ -1,18 +1,29 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 import snowflake.connector
-import pandas as pd
 from pathlib import Path
 from dataclasses import dataclass
 import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 from rich.console import Console
+from rich.text import Text
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import threading
+import atexit
+import functools
+import itertools
+import logging
+import queue
+import re
 import tempfile
-import os
-import numpy as np
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
+import uuid
+from contextlib import contextmanager
 
 from warehouse_to_go.utils.config import Config
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class ExtractionTask:
     database: str
@@ -22,6 +33,240 @@ class ExtractionTask:
     row_limit: int = 10000
     batch_size: int = 10000
 
+# Rows DuckDB processes per vector
+DUCKDB_VECTOR_SIZE = 2048
+
+# Snowflake result chunks a worker may fetch ahead of the DuckDB writer
+STREAM_BUFFER_CHUNKS = 8
+
+# Fully qualified database.schema.table names accepted for extraction
+_TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_$]+(\.[A-Za-z0-9_$]+){0,2}$')
+
+# database.schema plan keys accepted for extraction
+_SCHEMA_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_$]+\.[A-Za-z0-9_$]+$')
+
+# Idle Snowflake connections shared by every extractor in this process, keyed
+# by their non-secret login settings so repeated commands skip re-authentication
+_idle_connections: Dict[tuple, List[snowflake.connector.SnowflakeConnection]] = {}
+_idle_connections_lock = threading.Lock()
+
+def _is_connection_alive(conn: snowflake.connector.SnowflakeConnection) -> bool:
+    """Check that a cached connection can still run queries."""
+    if conn.is_closed():
+        return False
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1", timeout=5)
+        return True
+    except Exception:
+        return False
+
+@atexit.register
+def _close_idle_connections() -> None:
+    """Close all cached Snowflake connections at interpreter exit."""
+    with _idle_connections_lock:
+        for connections in _idle_connections.values():
+            for conn in connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        _idle_connections.clear()
+
+class _StreamAborted(Exception):
+    """Raised to a worker whose _ArrowStream the DuckDB writer stopped reading."""
+
+class _ArrowStream:
+    """
+    Bounded hand-off of Arrow chunks from a fetching worker to the DuckDB writer.
+    
+    The worker keeps putting Snowflake chunks while the writer thread reads
+    them through reader(), so fetching overlaps with DuckDB inserts without
+    holding more than maxsize chunks per table in memory. The writer is the
+    only consumer; once it is done with the stream it calls abort(), after
+    which put() raises _StreamAborted instead of blocking.
+    """
+    
+    _END = object()
+    
+    # How often a put() or get() blocked on the buffer checks for abort()
+    _POLL_SECONDS = 0.1
+    
+    def __init__(self, schema: pa.Schema, max_rows: int, maxsize: int):
+        self._schema = schema
+        self._max_rows = max_rows
+        self._chunks: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._aborted = threading.Event()
+        
+    def put(self, chunk: pa.Table) -> None:
+        """Queue a chunk, blocking while the buffer is full."""
+        self._offer(chunk)
+        
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """End the stream; the reader raises error instead when one is given."""
+        try:
+            self._offer(self._END if error is None else error)
+        except _StreamAborted:
+            pass
+        
+    def abort(self) -> None:
+        """Stop the stream; blocked and later put() and get() calls raise _StreamAborted."""
+        self._aborted.set()
+        
+    def _offer(self, item: Any) -> None:
+        while True:
+            if self._aborted.is_set():
+                raise _StreamAborted()
+            try:
+                self._chunks.put(item, timeout=self._POLL_SECONDS)
+                return
+            except queue.Full:
+                pass
+            
+    def _take(self) -> Any:
+        while True:
+            try:
+                return self._chunks.get(timeout=self._POLL_SECONDS)
+            except queue.Empty:
+                # DuckDB scan threads can still be pulling after a failed write
+                if self._aborted.is_set():
+                    raise _StreamAborted()
+        
+    def _iter_chunks(self) -> Iterator[pa.Table]:
+        while True:
+            item = self._take()
+            if item is self._END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+            
+    def reader(self) -> pa.RecordBatchReader:
+        """Reader over the queued chunks, re-sliced into max_rows batches."""
+        batches = (
+            batch
+            for chunk in self._iter_chunks()
+            for batch in chunk.to_batches(max_chunksize=self._max_rows)
+        )
+        return pa.RecordBatchReader.from_batches(self._schema, batches)
+
+class _DuckDBWriter:
+    """
+    Single background thread that owns every write to a DuckDB connection.
+    
+    Statements run one at a time in the order they are submitted. A
+    statement may come with an Arrow table or _ArrowStream, exposed as
+    arrow_stream while it runs.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, conn: duckdb.DuckDBPyConnection):
+        self._conn = conn
+        self._pending: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="duckdb-writer", daemon=True)
+        self._thread.start()
+        
+    def submit(self, sql: str, source: Union[pa.Table, _ArrowStream, None] = None) -> Future:
+        """Queue a statement; the returned future completes once it has run."""
+        done: Future = Future()
+        self._pending.put((sql, source, done))
+        return done
+        
+    def write(self, sql: str, table: Optional[pa.Table] = None) -> None:
+        """Run a statement on the writer thread and wait for it."""
+        self.submit(sql, table).result()
+        
+    def close(self) -> None:
+        """Stop the writer thread once every queued statement has run."""
+        self._pending.put(self._STOP)
+        self._thread.join()
+        
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is self._STOP:
+                return
+            sql, source, done = item
+            try:
+                if source is None:
+                    self._conn.execute(sql)
+                else:
+                    stream = source if isinstance(source, _ArrowStream) else None
+                    self._conn.register('arrow_stream', source if stream is None else stream.reader())
+                    try:
+                        self._conn.execute(sql)
+                    finally:
+                        # Never leave the data pinned by the connection, and
+                        # stop a worker still fetching for a failed write
+                        self._conn.unregister('arrow_stream')
+                        if stream is not None:
+                            stream.abort()
+            except BaseException as e:
+                done.set_exception(e)
+            else:
+                done.set_result(None)
+
+@functools.lru_cache(maxsize=4)
+def _load_private_key_bytes(path: str, passphrase: Optional[str]) -> bytes:
+    """Load a PEM private key as the DER bytes Snowflake expects, once per key."""
+    # Only key-pair auth needs cryptography, which is slow to import
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.backends import default_backend
+    
+    with open(path, 'rb') as key:
+        p_key = serialization.load_pem_private_key(
+            key.read(),
+            password=passphrase.encode() if passphrase else None,
+            backend=default_backend()
+        )
+        
+    # Convert to bytes in the format Snowflake expects
+    return p_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
+def _quote_identifier(name: str) -> str:
+    """Quote a (possibly dotted) name for DuckDB so reserved words are safe."""
+    return '.'.join('"' + part.replace('"', '""') + '"' for part in name.split('.'))
+
+def _quote_literal(value: str) -> str:
+    """Quote a value as a single-quoted SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+@functools.lru_cache(maxsize=256)
+def _duckdb_casts(schema: pa.Schema) -> Tuple[Tuple[int, pa.DataType], ...]:
+    """
+    Columns of an Arrow result schema that must be widened, computed once per schema.
+    
+    Snowflake picks the narrowest integer type per result chunk, so narrow
+    integer and float columns are widened to 64 bits to give every chunk of
+    a table the same schema.
+    """
+    casts = []
+    for i, field in enumerate(schema):
+        if pa.types.is_integer(field.type) and field.type != pa.int64():
+            casts.append((i, pa.int64()))
+        elif pa.types.is_floating(field.type) and field.type != pa.float64():
+            casts.append((i, pa.float64()))
+    return tuple(casts)
+
+# DuckDB names for the types _duckdb_casts widens to
+_DUCKDB_TYPE_NAMES = {pa.int64(): 'BIGINT', pa.float64(): 'DOUBLE'}
+
+def _duckdb_select_list(schema: pa.Schema) -> str:
+    """SELECT list applying _duckdb_casts in SQL, for files DuckDB reads itself."""
+    casts = dict(_duckdb_casts(schema))
+    if not casts:
+        return '*'
+    columns = ['"' + name.replace('"', '""') + '"' for name in schema.names]
+    return ', '.join(
+        f"CAST({column} AS {_DUCKDB_TYPE_NAMES[casts[i]]}) AS {column}" if i in casts else column
+        for i, column in enumerate(columns)
+    )
+
 def test_connection(config: Config) -> None:
     """Test Snowflake connection using the provided configuration."""
     with SnowflakeExtractor(config) as extractor:
@@ -33,7 +278,15 @@ class SnowflakeExtractor:
     def __init__(self, config: Config):
         """Initialize with configuration."""
         self.config = config
-        self.conn = None
+        # Connection arguments (including the decoded private key) are built
+        # once and reused for every pooled connection
+        self._conn_params = self._build_conn_params()
+        # Pool of connections handed out to worker threads, grown on demand
+        # up to pool_size
+        self._pool: queue.Queue = queue.Queue()
+        self._pool_members: List[snowflake.connector.SnowflakeConnection] = []
+        self._pool_opened = 0
+        self._pool_lock = threading.Lock()
         
     def __enter__(self):
         """Context manager entry."""
@@ -41,181 +294,390 @@ class SnowflakeExtractor:
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.conn:
-            self.conn.close()
+        # Pooled connections go back to the process-wide cache for reuse and
+        # are closed at interpreter exit
+        with self._pool_lock:
+            members, self._pool_members = self._pool_members, []
+            self._pool = queue.Queue()
+            self._pool_opened = 0
+        for conn in members:
+            cursor = conn.__dict__.pop('_wh2go_cursor', None)
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+        if members:
+            with _idle_connections_lock:
+                _idle_connections.setdefault(self._connection_key, []).extend(members)
+            
+    # Config is frozen, so values derived from it are computed once
+    @functools.cached_property
+    def pool_size(self) -> int:
+        """Maximum number of concurrent Snowflake connections."""
+        return max(1, self.config.extract.parallelism or self.config.warehouse.threads)
+    
+    @functools.cached_property
+    def _connection_key(self) -> tuple:
+        """Key identifying connections this extractor can share."""
+        # Every login setting that shapes the session, but no secrets
+        warehouse = self.config.warehouse
+        return (
+            warehouse.account,
+            warehouse.user,
+            warehouse.warehouse,
+            warehouse.role,
+            warehouse.database,
+            warehouse.schema,
+            warehouse.query_tag,
+            warehouse.client_session_keep_alive,
+        )
             
     def test_connection(self) -> None:
         """Test the Snowflake connection."""
-        self._get_connection().close()
+        with self._acquire():
+            pass
             
-    def _get_connection(self) -> snowflake.connector.SnowflakeConnection:
-        """Get or create Snowflake connection."""
-        if not self.conn:
-            # Create connection
-            conn_params = {
-                'account': self.config.warehouse.account,
-                'user': self.config.warehouse.user,
-                'warehouse': self.config.warehouse.warehouse,
-                'role': self.config.warehouse.role,
-                'database': self.config.warehouse.database,
-                'schema': self.config.warehouse.schema,
-                'client_session_keep_alive': self.config.warehouse.client_session_keep_alive,
-                'query_tag': self.config.warehouse.query_tag,
-            }
-            
-            # Add authentication
-            if self.config.warehouse.private_key_path:
-                with open(self.config.warehouse.private_key_path, 'rb') as key:
-                    p_key = serialization.load_pem_private_key(
-                        key.read(),
-                        password=self.config.warehouse.private_key_passphrase.encode() if self.config.warehouse.private_key_passphrase else None,
-                        backend=default_backend()
-                    )
-                    
-                # Convert to bytes in the format Snowflake expects
-                pkb = p_key.private_bytes(
-                    encoding=serialization.Encoding.DER,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption()
-                )
-                conn_params['private_key'] = pkb
-            elif self.config.warehouse.password:
-                conn_params['password'] = self.config.warehouse.password
+    @contextmanager
+    def _acquire(self) -> Iterator[snowflake.connector.SnowflakeConnection]:
+        """Borrow a pooled connection, opening a new one while below pool_size."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                # Reserve a slot so the (slow) connect can happen outside the lock
+                grow = self._pool_opened < self.pool_size
+                if grow:
+                    self._pool_opened += 1
+            if grow:
+                try:
+                    conn = self._checkout_idle() or self._connect()
+                except Exception:
+                    with self._pool_lock:
+                        self._pool_opened -= 1
+                    raise
+                with self._pool_lock:
+                    self._pool_members.append(conn)
             else:
-                raise ValueError("No authentication method provided")
+                conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
             
-            self.conn = snowflake.connector.connect(**conn_params)
+    def _cursor(self, conn: snowflake.connector.SnowflakeConnection) -> "snowflake.connector.cursor.SnowflakeCursor":
+        """Return the cursor reused for every statement run on a pooled connection."""
+        # A pooled connection is only used by one worker at a time, so its
+        # cursor can be shared by every table that worker extracts
+        cursor = conn.__dict__.get('_wh2go_cursor')
+        if cursor is None:
+            cursor = conn._wh2go_cursor = conn.cursor()
+        return cursor
             
-        return self.conn
+    def _checkout_idle(self) -> Optional[snowflake.connector.SnowflakeConnection]:
+        """Take a live connection from the process-wide cache, if any."""
+        while True:
+            with _idle_connections_lock:
+                connections = _idle_connections.get(self._connection_key)
+                if not connections:
+                    return None
+                conn = connections.pop()
+            if _is_connection_alive(conn):
+                return conn
+            try:
+                conn.close()
+            except Exception:
+                pass
+    
+    def _build_conn_params(self) -> Dict[str, Any]:
+        """Build the snowflake.connector.connect() arguments from the config."""
+        warehouse = self.config.warehouse
+        conn_params = {
+            'account': warehouse.account,
+            'user': warehouse.user,
+            'warehouse': warehouse.warehouse,
+            'role': warehouse.role,
+            'database': warehouse.database,
+            'schema': warehouse.schema,
+            'client_session_keep_alive': warehouse.client_session_keep_alive,
+        }
+        # Warehouse and query tag are applied server-side at login, saving a
+        # round-trip per connection
+        if warehouse.query_tag:
+            conn_params['session_parameters'] = {'QUERY_TAG': warehouse.query_tag}
+        
+        # Add authentication
+        if warehouse.private_key_path:
+            conn_params['private_key'] = _load_private_key_bytes(
+                warehouse.private_key_path,
+                warehouse.private_key_passphrase
+            )
+        elif warehouse.password:
+            conn_params['password'] = warehouse.password
+        else:
+            raise ValueError("No authentication method provided")
+        
+        return conn_params
+    
+    def _connect(self) -> snowflake.connector.SnowflakeConnection:
+        """Open a new Snowflake connection."""
+        return snowflake.connector.connect(**self._conn_params)
+    
+    def _convert_arrow_for_duckdb(self, table: pa.Table) -> pa.Table:
+        """
+        Normalize an Arrow result chunk for DuckDB.
+        
+        Only the columns flagged by _duckdb_casts are cast; when none need it
+        (the common case) the original table is returned without copying.
+        """
+        for i, new_type in _duckdb_casts(table.schema):
+            table = table.set_column(i, table.schema.field(i).with_type(new_type), table.column(i).cast(new_type))
+        return table
+    
+    def _rows_per_batch(self, table: pa.Table) -> int:
+        """Number of rows per RecordBatch to hit the configured batch_bytes target."""
+        bytes_per_row = max(1, table.nbytes // max(1, table.num_rows))
+        # Never go below DuckDB's vector size; tiny batches cost more than they save
+        return max(DUCKDB_VECTOR_SIZE, self.config.extract.batch_bytes // bytes_per_row)
     
-    def _convert_df_for_duckdb(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Convert DataFrame to types compatible with DuckDB."""
-        # Replace NaN with None
-        df = df.replace({np.nan: None})
+    def _extract_table(self, writer: _DuckDBWriter, full_table_name: str) -> int:
+        """
+        Extract a single table from Snowflake into DuckDB.
         
-        # Convert integer columns to Int64 (nullable integer)
-        for col in df.select_dtypes(include=['int']).columns:
-            df[col] = df[col].astype('Int64')
+        Runs on a worker thread with a pooled Snowflake connection; DuckDB
+        writes are handed to the single writer thread.
+        
+        Returns:
+            Number of rows written
+        """
+        # Names come from the manifest and are interpolated into DuckDB DDL
+        if not _TABLE_NAME_PATTERN.match(full_table_name):
+            raise ValueError(f"Invalid table name: {full_table_name!r}")
+        
+        # Full extracts are unloaded to Parquet server-side, which is much
+        # faster than pulling every row through the connector
+        extract = self.config.extract
+        row_limit = int(extract.row_limit or 0)
+        if row_limit <= 0:
+            return self._unload_table(writer, full_table_name)
+        
+        # Bind the table name and limit the rows
+        query = f"SELECT * FROM identifier(%s) LIMIT {row_limit}"
+        
+        with self._acquire() as conn:
+            cursor = self._cursor(conn)
+            cursor.arraysize = extract.batch_size
+            cursor.execute(query, (full_table_name,))
             
-        # Convert float columns to float64
-        for col in df.select_dtypes(include=['float']).columns:
-            df[col] = df[col].astype('float64')
+            # Stream Snowflake's Arrow result chunks into DuckDB so the full
+            # result is never materialized; this worker keeps fetching while
+            # the writer thread inserts what has arrived
+            chunks = cursor.fetch_arrow_batches()
+            first = next(chunks, None)
+            if first is None:
+                # Still replace the table so an emptied source leaves no stale rows
+                first = cursor.fetch_arrow_all(force_return_table=True)
+            first = self._convert_arrow_for_duckdb(first)
             
-        # Convert datetime columns to strings to avoid timezone issues
-        # for col in df.select_dtypes(include=['datetime']).columns:
-            # df[col] = df[col].astype(str)
+            # Re-slice Snowflake's (multi-MB) chunks into cache-sized batches
+            stream = _ArrowStream(first.schema, self._rows_per_batch(first), STREAM_BUFFER_CHUNKS)
+            done = writer.submit(f"""
+                CREATE OR REPLACE TABLE {_quote_identifier(full_table_name)} AS 
+                SELECT * FROM arrow_stream
+            """, stream)
+            row_count = 0
+            try:
+                for chunk in itertools.chain([first], map(self._convert_arrow_for_duckdb, chunks)):
+                    stream.put(chunk)
+                    row_count += chunk.num_rows
+            except _StreamAborted:
+                # The write failed; done.result() below raises its error
+                pass
+            except BaseException as e:
+                # Fail the CREATE so no partial table is written
+                stream.close(e)
+                raise
+            else:
+                stream.close()
             
-        return df
+        # The connection is free once everything is fetched
+        done.result()
+        return row_count
+    
+    def _unload_table(self, writer: _DuckDBWriter, full_table_name: str) -> int:
+        """
+        Copy a whole table into DuckDB via Parquet files unloaded to the user stage.
+        
+        Snowflake writes the files in parallel with COPY INTO, they are
+        downloaded with GET and loaded with read_parquet; the stage files
+        are always removed afterwards.
+        
+        Returns:
+            Number of rows written
+        """
+        stage_path = f"@~/warehouse_to_go/{uuid.uuid4().hex}/"
+        with self._acquire() as conn, tempfile.TemporaryDirectory() as tmpdir:
+            cursor = self._cursor(conn)
+            try:
+                cursor.execute(
+                    f"COPY INTO {stage_path} FROM (SELECT * FROM identifier(%s)) "
+                    "FILE_FORMAT = (TYPE = PARQUET COMPRESSION = SNAPPY) "
+                    "MAX_FILE_SIZE = 268435456 HEADER = TRUE",
+                    (full_table_name,)
+                )
+                # COPY INTO reports (rows_unloaded, input_bytes, output_bytes);
+                # no result row at all means nothing was unloaded
+                result = cursor.fetchone()
+                row_count = result[0] if result else 0
+                if not row_count:
+                    # Nothing was unloaded; still replace the table with an
+                    # empty one so an emptied source leaves no stale rows
+                    cursor.execute("SELECT * FROM identifier(%s) LIMIT 0", (full_table_name,))
+                    empty = self._convert_arrow_for_duckdb(cursor.fetch_arrow_all(force_return_table=True))
+                    writer.write(f"""
+                        CREATE OR REPLACE TABLE {_quote_identifier(full_table_name)} AS 
+                        SELECT * FROM arrow_stream
+                    """, empty)
+                    return 0
+                
+                local_dir = Path(tmpdir).as_posix()
+                cursor.execute(f"GET {stage_path} {_quote_literal(f'file://{local_dir}/')}")
+                files = sorted(Path(tmpdir).glob('*.parquet'))
+                if not files:
+                    raise RuntimeError(f"GET downloaded no Parquet files from {stage_path}")
+                
+                # Widen columns the same way as streamed extracts
+                columns = _duckdb_select_list(pq.read_schema(files[0]))
+                writer.write(f"""
+                    CREATE OR REPLACE TABLE {_quote_identifier(full_table_name)} AS 
+                    SELECT {columns} FROM read_parquet({_quote_literal(f'{local_dir}/*.parquet')})
+                """)
+            finally:
+                # A cleanup failure must not mask the error that got us here
+                try:
+                    cursor.execute(f"REMOVE {stage_path}")
+                except Exception as e:
+                    logger.warning("Failed to remove unloaded files at %s: %s", stage_path, e)
+                    
+        return row_count
     
     def extract_tables(self, plan: Dict[str, List[Dict[str, Any]]]) -> None:
         """
         Extract tables from Snowflake according to the plan.
         
+        Tables are extracted concurrently using pool_size worker threads,
+        each borrowing a connection from the extractor's pool; a single
+        background thread performs all DuckDB writes.
+        
         Args:
             plan: Dictionary mapping database.schema to list of tables to extract
-            
-        Returns:
-            Dictionary mapping table names to extracted DataFrames
         """
-        results = {}
         console = Console()
         schema_stats = {}  # Track stats by schema
+        # Status markers are built once; per-table lines skip markup
+        # parsing and auto-highlighting
+        succeeded = Text("✓", style="green")
+        failed = Text("✗", style="red")
+        
+        # Plan keys are interpolated into the DuckDB DDL script, so drop
+        # malformed ones up front rather than failing every table
+        invalid = [db_schema for db_schema in plan if not _SCHEMA_NAME_PATTERN.match(db_schema)]
+        for db_schema in invalid:
+            console.print(failed, f"{db_schema}: Invalid database.schema name, skipping {len(plan[db_schema])} tables", style="red", markup=False, highlight=False)
+        if invalid:
+            plan = {db_schema: tables for db_schema, tables in plan.items() if db_schema not in invalid}
         
         # Calculate total tables across all schemas
         total_tables = sum(len(tables) for tables in plan.values())
         console.print(f"\n[bold]Starting extraction of {total_tables} tables...[/bold]\n")
 
-        # Get connection
-        conn = self._get_connection()
+        # Fail fast on connection problems before touching DuckDB
+        self.test_connection()
         
         # Create DuckDB connection
-        os.makedirs('databases', exist_ok=True)
-        duckdb_conn = duckdb.connect(os.path.join('databases', str(self.config.duckdb.database_path)))
+        duckdb_config = self.config.duckdb
+        duckdb_conn = duckdb.connect(str(duckdb_config.resolved_path))
+        writer = None
         
         try:
-            # Process each database.schema
+            # Attach every database and create every schema in DuckDB up front
+            # with a single multi-statement script
+            databases = dict.fromkeys(db_schema.partition('.')[0] for db_schema in plan)
+            ddl = []
+            for database in databases:
+                path = duckdb_config.attached_database_path(database).as_posix()
+                ddl.append(f"ATTACH IF NOT EXISTS DATABASE {_quote_literal(path)} AS {_quote_identifier(database)}")
+            ddl += [f"CREATE SCHEMA IF NOT EXISTS {_quote_identifier(db_schema)}" for db_schema in plan]
+            if ddl:
+                duckdb_conn.execute(";\n".join(ddl))
+            
+            # Collect the tables to extract
+            tasks = []
             for db_schema, tables in plan.items():
-                database, schema = db_schema.split('.')
-                
-                # Initialize schema stats
-                schema_key = f"{database}.{schema}"
-                schema_stats[schema_key] = {
+                # Plan keys are already database.schema, so they double as
+                # the stats key and the table name prefix
+                schema_stats[db_schema] = {
                     'tables': 0,
                     'rows': 0
                 }
                 
-                # Attach database and create schema in DuckDB if they don't exist
-                duckdb_conn.execute(f"ATTACH IF NOT EXISTS DATABASE 'databases/{database}.duckdb' AS {database}")
-                duckdb_conn.execute(f"CREATE SCHEMA IF NOT EXISTS {database}.{schema}")
-                
-                # Extract each table
-                for i, table in enumerate(tables, 1):
-                    table_name = table['table_name']
-                    full_table_name = f"{database}.{schema}.{table_name}"
+                for table in tables:
+                    tasks.append((db_schema, f"{db_schema}.{table['table_name']}"))
+            
+            # Extract tables concurrently; Snowflake round-trips dominate, so
+            # workers keep fetching while one thread does the DuckDB writes
+            max_workers = max(1, min(self.pool_size, len(tasks)))
+            writer = _DuckDBWriter(duckdb_conn)
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[bold blue]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            )
+            def extract_with_progress(full_table_name: str) -> int:
+                # One indeterminate progress row per in-flight table
+                # (Progress is thread-safe)
+                table_task = progress.add_task(full_table_name, total=None)
+                try:
+                    return self._extract_table(writer, full_table_name)
+                finally:
+                    progress.remove_task(table_task)
+            
+            with progress, ThreadPoolExecutor(max_workers=max_workers) as executor:
+                task_id = progress.add_task("Extracting", total=total_tables)
+                futures = {
+                    executor.submit(extract_with_progress, full_table_name): (schema_key, full_table_name)
+                    for schema_key, full_table_name in tasks
+                }
+                for future in as_completed(futures):
+                    schema_key, full_table_name = futures[future]
+                    progress.advance(task_id)
+                    try:
+                        row_count = future.result()
+                    except Exception as e:
+                        progress.console.print(failed, f"{full_table_name}: Failed to extract - {str(e)}", style="red", markup=False, highlight=False)
+                        continue
                     
-                    with console.status(f"[bold blue]Extracting [{i}/{total_tables}] {full_table_name}...") as status:
-                        # Build query with row limit
-                        query = f"""
-                        SELECT *
-                        FROM identifier('{full_table_name}')
-                        LIMIT {self.config.extract.row_limit}
-                        """
-                            
-                        # Execute query and fetch results
-                        cursor = conn.cursor()
-                        try:
-                            cursor.execute(f'USE WAREHOUSE {self.config.warehouse.warehouse}')
-                            cursor.execute(query)
-                        except Exception as e:
-                            console.print(f"[red]✗[/red] {full_table_name}: Failed to extract - {str(e)}", style="red")
-                            continue
-                        
-                        # Fetch in batches
-                        while True:
-                            df = cursor.fetch_pandas_all()
-                            if df is None or len(df) == 0:
-                                break
-                                
-                            # Convert types for DuckDB compatibility
-                            df = self._convert_df_for_duckdb(df)
-                            
-                            try:
-                                # Try writing directly to DuckDB
-                                duckdb_conn.execute(f"""
-                                    CREATE OR REPLACE TABLE {full_table_name} AS 
-                                    SELECT * FROM table_name
-                                """)
-                                console.print(f"[green]✓[/green] {full_table_name}: {len(df):,} rows")
-                            except Exception as e:
-                                # If direct write fails, try using parquet as intermediate
-                                with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as tmp:
-                                    df.to_parquet(tmp.name)
-                                    try:
-                                        duckdb_conn.execute(f"DROP TABLE IF EXISTS {full_table_name}")
-                                        duckdb_conn.execute(f"""
-                                            CREATE TABLE {full_table_name} AS 
-                                            SELECT * FROM parquet_scan('{tmp.name}')
-                                        """)
-                                        console.print(f"[green]✓[/green] {full_table_name}: {len(df):,} rows")
-                                    finally:
-                                        os.unlink(tmp.name)
-                            
-                            # Update schema stats
-                            schema_stats[schema_key]['tables'] += 1
-                            schema_stats[schema_key]['rows'] += len(df)
-
-                            # Only process one batch if row_limit is hit
-                            if self.config.extract.row_limit:
-                                break
-                                
-                        cursor.close()
+                    progress.console.print(succeeded, f"{full_table_name}: {row_count:,} rows", markup=False, highlight=False)
+                    
+                    # Update schema stats
+                    schema_stats[schema_key]['tables'] += 1
+                    schema_stats[schema_key]['rows'] += row_count
                         
         finally:
+            if writer is not None:
+                writer.close()
             duckdb_conn.close()
             
         # Print schema summary
         console.print("\n[bold]Extraction Summary:[/bold]")
-        for schema, stats in schema_stats.items():
-            console.print(f"  • {schema}: {stats['tables']} tables, {stats['rows']:,} rows")
+        lines = [
+            f"  • {schema}: {stats['tables']} tables, {stats['rows']:,} rows"
+            for schema, stats in schema_stats.items()
+        ]
+        if lines:
+            console.print("\n".join(lines), markup=False, highlight=False)
             
         return
@@ -1,9 +1,29 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 import yaml
 
-@dataclass
+# Prefer libyaml's C loader, which is much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Directory holding every DuckDB database file created by the tool
+DATABASES_DIR = Path("databases")
+
+def load_yaml(path: Union[str, Path]) -> dict:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+@lru_cache(maxsize=4)
+def _load_profiles(path: str, mtime_ns: int) -> dict:
+    """Parse profiles.yml, memoized until the file is modified."""
+    return load_yaml(path)
+
+@dataclass(frozen=True)
 class WarehouseConfig:
     """Configuration for warehouse connection."""
     account: str
@@ -41,20 +61,21 @@ class WarehouseConfig:
         if not profiles_path.exists():
             raise FileNotFoundError(f"dbt profiles.yml not found at {profiles_path}")
 
-        with open(profiles_path) as f:
-            profiles = yaml.safe_load(f)
+        profiles = _load_profiles(str(profiles_path), profiles_path.stat().st_mtime_ns)
 
         # If profile_name not provided, use first profile that has a warehouse connection
         if not profile_name:
-            for name, config in profiles.items():
-                if isinstance(config, dict) and 'outputs' in config:
-                    for output_name, output_config in config['outputs'].items():
-                        if output_config.get('type') == 'snowflake':
-                            profile_name = name
-                            target = target or output_name
-                            break
-                    if profile_name:
-                        break
+            profile_name, output_name = next(
+                (
+                    (name, output_name)
+                    for name, config in profiles.items()
+                    if isinstance(config, dict) and 'outputs' in config
+                    for output_name, output_config in config['outputs'].items()
+                    if output_config.get('type') == 'snowflake'
+                ),
+                (None, None)
+            )
+            target = target or output_name
 
         if not profile_name:
             raise ValueError("No warehouse profile found in profiles.yml")
@@ -92,23 +113,37 @@ class WarehouseConfig:
 
         return cls(**warehouse_config)
 
-@dataclass
+@dataclass(frozen=True)
 class DuckDBConfig:
     """Configuration for DuckDB connection."""
     database_path: Path
 
-@dataclass
+    @cached_property
+    def resolved_path(self) -> Path:
+        """Path of the main DuckDB database, creating its directory on first access."""
+        path = DATABASES_DIR / self.database_path
+        DATABASES_DIR.mkdir(parents=True, exist_ok=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def attached_database_path(self, database: str) -> Path:
+        """Path of the DuckDB file attached for a warehouse database."""
+        return DATABASES_DIR / f"{database}.duckdb"
+
+@dataclass(frozen=True)
 class ExtractConfig:
     """Configuration for data extraction settings."""
     row_limit: int = 10000  # Default limit of rows per table
     batch_size: int = 10000  # Number of rows to fetch at once
+    batch_bytes: int = 262_144  # Target size of each Arrow batch handed to DuckDB
+    parallelism: Optional[int] = None  # Tables to extract concurrently; defaults to the dbt profile's threads
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Main configuration class for the application."""
     warehouse: WarehouseConfig
     duckdb: DuckDBConfig
-    extract: ExtractConfig = ExtractConfig()
+    extract: ExtractConfig = field(default_factory=ExtractConfig)
     manifest_path: Path = Path("target/manifest.json")
     
     @classmethod
@@ -158,7 +193,9 @@ class Config:
             ),
             extract=ExtractConfig(
                 row_limit=config_dict.get("extract", {}).get("row_limit", 10000),
-                batch_size=config_dict.get("extract", {}).get("batch_size", 10000)
+                batch_size=config_dict.get("extract", {}).get("batch_size", 10000),
+                batch_bytes=config_dict.get("extract", {}).get("batch_bytes", 262_144),
+                parallelism=config_dict.get("extract", {}).get("parallelism")
             ),
             manifest_path=manifest_path,
         )